@@ -1,32 +1,32 @@
-import struct, os
+import mmap, struct, os
 import zstandard as zstd
-import bson
+from bson.raw_bson import RawBSONDocument
+import numpy as np
 
 HEADER_LENGTH = 32
+DCTX = zstd.ZstdDecompressor()
 
 path = r'C:\Users\Sotirios\Desktop\KOC\run\universe\worlds\default\chunks\0.0.region.bin'
 print(f"Reading: {path}")
 print(f"File size: {os.path.getsize(path)} bytes")
 
-with open(path, 'rb') as f:
-    magic = f.read(20)
-    version = struct.unpack('>I', f.read(4))[0]
-    blob_count = struct.unpack('>I', f.read(4))[0]
-    segment_size = struct.unpack('>I', f.read(4))[0]
-    indices = [struct.unpack('>I', f.read(4))[0] for _ in range(blob_count)]
+with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    if hasattr(mmap, 'MADV_WILLNEED'):
+        mm.madvise(mmap.MADV_WILLNEED)  # read the whole region ahead rather than page by page
+    magic, version, blob_count, segment_size = struct.unpack_from('>20sIII', mm)
+    indices = struct.unpack_from(f'>{blob_count}I', mm, HEADER_LENGTH)
     
     chunks_with_water = 0
     for bi, fs in enumerate(indices):
         if fs == 0: continue
         segments_base = HEADER_LENGTH + blob_count * 4
         pos = segments_base + (fs - 1) * segment_size
-        f.seek(pos)
-        src_len = struct.unpack('>I', f.read(4))[0]
-        comp_len = struct.unpack('>I', f.read(4))[0]
-        comp_data = f.read(comp_len)
-        dctx = zstd.ZstdDecompressor()
-        raw = dctx.decompress(comp_data, max_output_size=src_len)
-        doc = bson.decode(raw)
+        src_len = struct.unpack_from('>I', mm, pos)[0]
+        comp_len = struct.unpack_from('>I', mm, pos + 4)[0]
+        with memoryview(mm)[pos + 8:pos + 8 + comp_len] as comp_data:
+            raw = DCTX.decompress(comp_data, max_output_size=src_len)
+        # Lazy document: only the sections actually walked below get inflated
+        doc = RawBSONDocument(raw)
         
         local_x = bi % 32
         local_z = bi // 32
@@ -35,7 +35,9 @@ with open(path, 'rb') as f:
         cc = doc['Components'].get('ChunkColumn', {})
         if 'Sections' not in cc:
             print("  No ChunkColumn/Sections")
-            break
+            continue
+        
+        has_water = False
         
         for si, sec in enumerate(cc['Sections']):
             comps = sec.get('Components', {})
@@ -45,14 +47,14 @@ with open(path, 'rb') as f:
             pt = fd[0]
             if pt == 0: continue
             
+            has_water = True
             p = 1
-            ec = struct.unpack('>H', fd[p:p+2])[0]; p += 2
+            ec = struct.unpack_from('>H', fd, p)[0]; p += 2
             entries = []
             for _ in range(ec):
-                iid = fd[p]; p += 1
-                sl = struct.unpack('>H', fd[p:p+2])[0]; p += 2
+                iid, sl = struct.unpack_from('>BH', fd, p); p += 3
                 nm = fd[p:p+sl].decode(); p += sl
-                cnt = struct.unpack('>H', fd[p:p+2])[0]; p += 2
+                cnt = struct.unpack_from('>H', fd, p)[0]; p += 2
                 entries.append((iid, nm, cnt))
             print(f'  Section {si} (Y {si*32}-{si*32+31}): palette={entries}')
             
@@ -61,19 +63,17 @@ with open(path, 'rb') as f:
             print(f'    has_levels={has_levels}')
             if has_levels:
                 ld = fd[p:p+16384]
-                levels_found = []
-                for i in range(32768):
-                    bi2 = i >> 1
-                    if (i & 1) == 0:
-                        lv = ld[bi2] & 0xF
-                    else:
-                        lv = (ld[bi2] >> 4) & 0xF
-                    if lv != 0 and len(levels_found) < 20:
-                        x = i & 0x1F
-                        z = (i >> 5) & 0x1F
-                        y = (i >> 10) & 0x1F
-                        levels_found.append(f'({x},{y},{z})=level{lv}')
+                arr = np.frombuffer(ld, dtype=np.uint8)
+                nibbles = np.empty(arr.size * 2, dtype=np.uint8)
+                nibbles[0::2] = arr & 0xF
+                nibbles[1::2] = arr >> 4
+                idx = np.flatnonzero(nibbles)[:20]
+                levels_found = [f'({i & 0x1F},{(i >> 10) & 0x1F},{(i >> 5) & 0x1F})=level{lv}'
+                                for i, lv in zip(idx.tolist(), nibbles[idx].tolist())]
                 print(f'    Levels: {levels_found}')
-        break  # Just first 5 chunks with water
-    chunks_with_water += 1
-    if chunks_with_water >= 5:
+                break  # Only the first section with levels per chunk
+        
+        if has_water:
+            chunks_with_water += 1
+            if chunks_with_water >= 5:  # Just first 5 chunks with water
+                break
@@ -1,20 +1,24 @@
 import re, os
+from collections import defaultdict
 
 BASE = r'c:\Users\Sotirios\Desktop\WorldPainter'
 
 # Read texture files
 tex_dir = os.path.join(BASE, 'HytaleAssets', 'Common', 'BlockTextures')
-tex_files = set()
-for f in os.listdir(tex_dir):
-    if os.path.isfile(os.path.join(tex_dir, f)):
-        tex_files.add(f.lower())
+with os.scandir(tex_dir) as it:
+    tex_files = {entry.name.lower() for entry in it if entry.is_file()}
 
 # Read terrain block IDs
 with open(os.path.join(BASE, 'WorldPainter/WPCore/src/main/java/org/pepsoft/worldpainter/hytale/HytaleTerrain.java'), 'r') as f:
     content = f.read()
 
-pattern = r'public static final HytaleTerrain (\w+)\s*=\s*new HytaleTerrain\([^,]+,\s*HytaleBlock\.of\("([^"]+)"\)'
-matches = re.findall(pattern, content)
+TERRAIN_BLOCK_RE = re.compile(r'public static final HytaleTerrain (\w+)\s*=\s*new HytaleTerrain\([^,]+,\s*HytaleBlock\.of\("([^"]+)"\)')
+matches = TERRAIN_BLOCK_RE.findall(content)
+
+# Texture file name suffixes to try for each base name, paired with their lowercase form
+TEXTURE_SUFFIXES = tuple((suffix, suffix.lower()) for suffix in (
+    '_Top.png', '.png', '_Top_GS.png', '_GS.png', '_Side.png', '_Side_GS.png', '_Side_Full_GS.png'
+))
 
 def check_candidates(block_id):
     """Check what texture candidates exist for a block ID."""
@@ -31,13 +35,10 @@ def check_candidates(block_id):
         bases.append(block_id.replace('Poisoned', 'Poisonned'))
     
     for base in bases:
-        candidates = [
-            base + '_Top.png', base + '.png', base + '_Top_GS.png', base + '_GS.png',
-            base + '_Side.png', base + '_Side_GS.png', base + '_Side_Full_GS.png'
-        ]
-        for c in candidates:
-            if c.lower() in tex_files:
-                found.append(c)
+        base_lower = base.lower()
+        for suffix, suffix_lower in TEXTURE_SUFFIXES:
+            if base_lower + suffix_lower in tex_files:
+                found.append(base + suffix)
     
     # Also check _Source -> Fluid_ 
     if block_id.endswith('_Source'):
@@ -51,10 +52,12 @@ print("=== BLOCK IDS WITH MATCHING TEXTURES ===")
 has_tex = 0
 no_tex = 0
 no_tex_list = []
+matched_textures = set()
 for name, block_id in matches:
     found = check_candidates(block_id)
     if found:
         has_tex += 1
+        matched_textures.update(f.lower() for f in found)
         print(f"  {name}: {block_id} -> {found}")
     else:
         no_tex += 1
@@ -96,13 +99,13 @@ for name, block_id in no_tex_list:
 
 # Also check: which texture files are NOT matched by any terrain?
 print("\n=== UNMATCHED TEXTURE FILES (potentially useful) ===")
-matched_textures = set()
-for name, block_id in matches:
-    found = check_candidates(block_id)
-    for f in found:
-        matched_textures.add(f.lower())
+prefix_buckets = defaultdict(list)
+for f in tex_files:
+    prefix, sep, _ = f.partition('_')
+    if sep:
+        prefix_buckets[prefix].append(f)
 
-plant_unmatched = [f for f in sorted(tex_files) if f.startswith('plant_') and f not in matched_textures]
-moss_unmatched = [f for f in sorted(tex_files) if f.startswith('moss_') and f not in matched_textures]
+plant_unmatched = sorted(f for f in prefix_buckets['plant'] if f not in matched_textures)
+moss_unmatched = sorted(f for f in prefix_buckets['moss'] if f not in matched_textures)
 print("Plant textures not matched:", plant_unmatched)
 print("Moss textures not matched:", moss_unmatched)
@@ -1,17 +1,12 @@
 import re
 from collections import Counter
 
-colors = []
+# Terrain name and the colour at the end of its (possibly multi-line) definition
+TERRAIN_COLOUR_RE = re.compile(r'public static final HytaleTerrain (\w+)\s*=[^;]*?(0x[0-9a-fA-F]{6})\)')
+
 with open(r'c:\Users\Sotirios\Desktop\WorldPainter\WorldPainter\WPCore\src\main\java\org\pepsoft\worldpainter\hytale\HytaleTerrain.java', 'r') as f:
-    pending = None
-    for line in f:
-        m = re.search(r'public static final HytaleTerrain (\w+)\s*=', line)
-        if m:
-            pending = m.group(1)
-        cm = re.search(r'(0x[0-9a-fA-F]{6})\)', line)
-        if pending and cm:
-            colors.append((pending, cm.group(1)))
-            pending = None
+    content = f.read()
+colors = [m.groups() for m in TERRAIN_COLOUR_RE.finditer(content)]
 
 color_values = [c[1].lower() for c in colors]
 unique = len(set(color_values))
@@ -29,7 +24,6 @@ else:
 # Show some samples for visual check
 print('\n--- Sample colors by category ---')
 categories = {}
-current_cat = 'unknown'
 for name, color in colors:
     if 'LEAVES' in name:
         current_cat = 'LEAVES'
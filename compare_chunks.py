@@ -3,63 +3,173 @@ Tool to compare Hytale region files between a working world and an exported worl
 Reads IndexedStorageFile format, decompresses Zstd blobs, parses BSON,
 and compares the fluid section data.
 """
+import importlib.util
+import mmap
+from array import array
 import struct
 import sys
 import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import zstandard as zstd
-except ImportError:
-    print("Installing zstandard...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "zstandard", "pymongo"])
-    import zstandard as zstd
+def install_missing_packages(*requirements):
+    """Pip-install the package for each (module, package) pair whose module cannot be found.
+
+    Only looks the modules up without importing them, so a warm start does no extra work.
+    """
+    missing = [package for module, package in requirements if importlib.util.find_spec(module) is None]
+    if missing:
+        print(f"Installing {', '.join(missing)}...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+        importlib.invalidate_caches()
+
+install_missing_packages(("zstandard", "zstandard"), ("bson", "pymongo"))
 
+import zstandard as zstd
 import bson
+from bson.raw_bson import RawBSONDocument
+
+# pymongo's bson ships a C extension; the standalone "bson" package (or a pymongo without its extension) decodes in
+# pure Python, which dominates the run time on large regions
+if not getattr(bson, "has_c", lambda: False)():
+    raise ImportError("The C-accelerated BSON extension is not available; install pymongo (and uninstall the "
+                      "standalone 'bson' package if present)")
+
+try:
+    import numpy as np
+except ImportError:
+    # Fall back to the pure-Python nibble scan below
+    np = None
 
 MAGIC_STRING = b"HytaleIndexedStorage"
 MAGIC_LENGTH = 20
 HEADER_LENGTH = 32
 
-def read_region_header(f):
+# Section components with a dedicated analyzer (or nothing worth reporting)
+KNOWN_SECTION_COMPONENTS = frozenset(("Block", "Fluid", "ChunkSection"))
+
+# Number of nibbles in a 16 KB nibble-packed section array (32x32x32 blocks)
+SECTION_VOLUME = 32768
+
+if np is None:
+    # Byte offset and bit shift of every nibble in a section array, so the pure-Python scan does no per-index
+    # arithmetic. Shifts are given for both nibble orders
+    NIBBLE_BYTE_INDEX = array("H", [i >> 1 for i in range(SECTION_VOLUME)])
+    LOW_FIRST_SHIFTS = bytes((i & 1) * 4 for i in range(SECTION_VOLUME))
+    HIGH_FIRST_SHIFTS = bytes((~i & 1) * 4 for i in range(SECTION_VOLUME))
+
+# Per-thread decompressor and reusable output buffer. Creating a decompressor per blob re-initialises its internal
+# state every time, but a single one may not be used by several threads at once
+thread_state = threading.local()
+
+def read_region_header(mm):
     """Read region file header."""
-    magic = f.read(MAGIC_LENGTH)
+    magic, version, blob_count, segment_size = struct.unpack_from(f">{MAGIC_LENGTH}sIII", mm)
     if magic != MAGIC_STRING:
         raise ValueError(f"Invalid magic: {magic}")
-    version = struct.unpack(">I", f.read(4))[0]
-    blob_count = struct.unpack(">I", f.read(4))[0]
-    segment_size = struct.unpack(">I", f.read(4))[0]
     return version, blob_count, segment_size
 
-def read_blob_index(f, blob_count):
+def read_blob_index(mm, blob_count):
     """Read blob index table."""
-    indices = []
-    for _ in range(blob_count):
-        idx = struct.unpack(">I", f.read(4))[0]
-        indices.append(idx)
-    return indices
+    return list(struct.unpack_from(f">{blob_count}I", mm, HEADER_LENGTH))
 
-def read_chunk(f, blob_index_entry, blob_count, segment_size):
-    """Read and decompress a single chunk from the region file."""
+def read_chunk(mm, blob_index_entry, blob_count, segment_size):
+    """Read and decompress a single chunk from the memory-mapped region file."""
     if blob_index_entry == 0:
         return None
     
     segments_base = HEADER_LENGTH + blob_count * 4
     position = segments_base + (blob_index_entry - 1) * segment_size
     
-    f.seek(position)
-    src_length = struct.unpack(">I", f.read(4))[0]
-    compressed_length = struct.unpack(">I", f.read(4))[0]
-    compressed_data = f.read(compressed_length)
-    
-    # Decompress with Zstd
-    dctx = zstd.ZstdDecompressor()
-    decompressed = dctx.decompress(compressed_data, max_output_size=src_length)
-    return decompressed
+    src_length = struct.unpack_from(">I", mm, position)[0]
+    compressed_length = struct.unpack_from(">I", mm, position + 4)[0]
+    data_start = position + 8
+    # Zero-copy view of the payload; released before returning so the mapping can be closed
+    with memoryview(mm)[data_start:data_start + compressed_length] as compressed_data:
+        return decompress_into_buffer(compressed_data, src_length)
+
+def decompress_into_buffer(compressed_data, src_length):
+    """Decompress a Zstd blob into the calling thread's output buffer.
+
+    Returns a memoryview of the first src_length bytes, which is only valid until the next call on the same thread.
+    """
+    if not hasattr(thread_state, "dctx"):
+        thread_state.dctx = zstd.ZstdDecompressor()
+        thread_state.output_buffer = bytearray(1 << 16)
+    if len(thread_state.output_buffer) < src_length:
+        # Grown on demand to the largest chunk seen so far
+        thread_state.output_buffer = bytearray(src_length)
+    view = memoryview(thread_state.output_buffer)[:src_length]
+    filled = 0
+    with thread_state.dctx.stream_reader(compressed_data) as reader:
+        while filled < src_length:
+            n = reader.readinto(view[filled:])
+            if n == 0:
+                raise ValueError(f"Truncated chunk: expected {src_length} bytes, got {filled}")
+            filled += n
+    return view
 
 def parse_bson_chunk(data):
-    """Parse BSON chunk data."""
-    return bson.decode(data)
+    """Parse BSON chunk data.
+
+    Returns a lazy RawBSONDocument so that only the subtrees actually read are converted to Python objects. It keeps
+    referring to data, so it is only valid for as long as data is.
+    """
+    return RawBSONDocument(data)
+
+def unpack_nibbles(packed, high_first=False):
+    """Unpack a nibble-packed byte array into one uint8 per 4-bit value.
+
+    Even indices take the low nibble of each byte unless high_first is set.
+    """
+    arr = np.frombuffer(packed, dtype=np.uint8)
+    low = arr & 0xF
+    high = arr >> 4
+    nibbles = np.empty(arr.size * 2, dtype=np.uint8)
+    if high_first:
+        nibbles[0::2] = high
+        nibbles[1::2] = low
+    else:
+        nibbles[0::2] = low
+        nibbles[1::2] = high
+    return nibbles
+
+def scan_nibbles(packed, high_first=False, sample_limit=20):
+    """Find the non-zero values in a nibble-packed section array.
+
+    Returns the number of non-zero nibbles and (index, value) pairs for the first sample_limit of them. Even indices
+    take the low nibble of each byte unless high_first is set.
+    """
+    if np is not None:
+        nibbles = unpack_nibbles(packed, high_first)
+        indices = np.flatnonzero(nibbles)
+        samples = indices[:sample_limit]
+        return len(indices), list(zip(samples.tolist(), nibbles[samples].tolist()))
+    shifts = HIGH_FIRST_SHIFTS if high_first else LOW_FIRST_SHIFTS
+    count = 0
+    samples = []
+    for i, byte_idx, shift in zip(range(len(packed) * 2), NIBBLE_BYTE_INDEX, shifts):
+        value = (packed[byte_idx] >> shift) & 0xF
+        if value != 0:
+            count += 1
+            if len(samples) < sample_limit:
+                samples.append((i, value))
+    return count, samples
+
+def read_palette_entries(data, pos, entry_count):
+    """Read entry_count palette entries starting at pos, returning them and the position after the last one."""
+    entries = []
+    for _ in range(entry_count):
+        # internal id (u8) and name length (u16) are contiguous, so unpack them together
+        internal_id, str_len = struct.unpack_from(">BH", data, pos)
+        name_end = pos + 3 + str_len
+        name = data[pos + 3:name_end].decode("utf-8")
+        count = struct.unpack_from(">H", data, name_end)[0]
+        pos = name_end + 2
+        entries.append({"id": internal_id, "name": name, "count": count})
+    return entries, pos
 
 def analyze_fluid_section(fluid_doc):
     """Analyze a fluid section BSON document."""
@@ -82,45 +192,28 @@ def analyze_fluid_section(fluid_doc):
         return result
     
     # Read palette entries
-    entry_count = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
+    entry_count = struct.unpack_from(">H", data, pos)[0]; pos += 2
     result["entry_count"] = entry_count
     
-    entries = []
-    for _ in range(entry_count):
-        internal_id = data[pos]; pos += 1
-        str_len = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
-        name = data[pos:pos+str_len].decode("utf-8"); pos += str_len
-        count = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
-        entries.append({"id": internal_id, "name": name, "count": count})
+    entries, pos = read_palette_entries(data, pos, entry_count)
     result["entries"] = entries
     
     # Read block data (nibble-packed for HALF_BYTE)
     if palette_type == 1:  # HALF_BYTE
         block_data = data[pos:pos+16384]; pos += 16384
         
-        # Count non-empty fluids
-        fluid_blocks = 0
-        fluid_positions = []
-        for i in range(32768):
-            byte_idx = i // 2
-            if i % 2 == 0:
-                nibble = (block_data[byte_idx] >> 4) & 0xF  # HIGH nibble for even
-            else:
-                nibble = block_data[byte_idx] & 0xF  # LOW nibble for odd
-            if nibble != 0:
-                fluid_blocks += 1
-                # Decode position: index = y<<10 | z<<5 | x
-                x = i & 0x1F
-                z = (i >> 5) & 0x1F
-                y = (i >> 10) & 0x1F
-                if len(fluid_positions) < 20:
-                    fluid_positions.append({"index": i, "x": x, "y": y, "z": z, "palette_idx": nibble})
+        # Count non-empty fluids (HIGH nibble for even index, LOW nibble for odd)
+        fluid_blocks, samples = scan_nibbles(block_data, high_first=True)
+        # Decode position: index = y<<10 | z<<5 | x
+        fluid_positions = [{"index": i, "x": i & 0x1F, "y": (i >> 10) & 0x1F, "z": (i >> 5) & 0x1F,
+                            "palette_idx": nibble}
+                           for i, nibble in samples]
         
         result["fluid_block_count"] = fluid_blocks
         result["sample_positions"] = fluid_positions
     elif palette_type == 2:  # BYTE
         block_data = data[pos:pos+32768]; pos += 32768
-        fluid_blocks = sum(1 for b in block_data if b != 0)
+        fluid_blocks = len(block_data) - block_data.count(0)
         result["fluid_block_count"] = fluid_blocks
     
     # Read level data
@@ -130,22 +223,11 @@ def analyze_fluid_section(fluid_doc):
     if has_levels:
         level_data = data[pos:pos+16384]; pos += 16384
         
-        # Count non-zero levels and examine
-        non_zero = 0
-        level_positions = []
-        for i in range(32768):
-            byte_idx = i // 2
-            if i % 2 == 0:
-                level = level_data[byte_idx] & 0xF  # LOW nibble for even
-            else:
-                level = (level_data[byte_idx] >> 4) & 0xF  # HIGH nibble for odd
-            if level != 0:
-                non_zero += 1
-                x = i & 0x1F
-                z = (i >> 5) & 0x1F
-                y = (i >> 10) & 0x1F
-                if len(level_positions) < 20:
-                    level_positions.append({"index": i, "x": x, "y": y, "z": z, "level": level})
+        # Count non-zero levels and examine (LOW nibble for even index, HIGH nibble for odd)
+        non_zero, samples = scan_nibbles(level_data)
+        level_positions = [{"index": i, "x": i & 0x1F, "y": (i >> 10) & 0x1F, "z": (i >> 5) & 0x1F,
+                            "level": level}
+                           for i, level in samples]
         
         result["non_zero_levels"] = non_zero
         result["sample_levels"] = level_positions
@@ -177,16 +259,10 @@ def analyze_block_section(block_doc):
     if palette_type == 0:
         return result
     
-    entry_count = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
+    entry_count = struct.unpack_from(">H", data, pos)[0]; pos += 2
     result["entry_count"] = entry_count
     
-    entries = []
-    for _ in range(entry_count):
-        internal_id = data[pos]; pos += 1
-        str_len = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
-        name = data[pos:pos+str_len].decode("utf-8"); pos += str_len
-        count = struct.unpack(">H", data[pos:pos+2])[0]; pos += 2
-        entries.append({"id": internal_id, "name": name, "count": count})
+    entries, pos = read_palette_entries(data, pos, entry_count)
     result["entries"] = entries
     
     return result
@@ -225,16 +301,13 @@ def analyze_heightmap(block_chunk_doc):
     # Decode some heightmap values
     bitfield_data = data[pos:pos+bitfield_length]; pos += bitfield_length
     
-    # Read first few heightmap entries (10 bits per entry)
+    # Read first few heightmap entries (10 bits per entry, LSB first); 64 entries span 80 bytes, so load them as
+    # one little-endian integer and mask out each lane. Missing trailing bytes read as zero bits
+    sample_count = min(64, 1024)
+    bits = int.from_bytes(bitfield_data[:(sample_count * 10 + 7) // 8], "little")
     sample_heights = []
-    for col_idx in range(min(64, 1024)):
-        bit_index = col_idx * 10
-        value = 0
-        for bit in range(10):
-            byte_idx = (bit_index + bit) // 8
-            bit_offset = (bit_index + bit) % 8
-            if byte_idx < len(bitfield_data):
-                value |= ((bitfield_data[byte_idx] >> bit_offset) & 1) << bit
+    for col_idx in range(sample_count):
+        value = (bits >> (col_idx * 10)) & 0x3FF
         x = col_idx & 0x1F
         z = col_idx >> 5
         actual_height = heights_palette[value] if value < len(heights_palette) else -1
@@ -244,6 +317,104 @@ def analyze_heightmap(block_chunk_doc):
     
     return result
 
+def analyze_chunk(mm, blob_idx, first_segment, blob_count, segment_size):
+    """Analyze a single chunk, returning its report lines and the traceback of any error.
+
+    Runs on a worker thread, so the report is collected rather than printed, and the decompressed data (which lives in
+    the thread's reusable buffer) is fully consumed before returning.
+    """
+    out = []
+    local_x = blob_idx % 32
+    local_z = blob_idx // 32
+    
+    out.append(f"\n  --- Chunk local ({local_x}, {local_z}) ---")
+    
+    try:
+        raw_data = read_chunk(mm, first_segment, blob_count, segment_size)
+        if raw_data is None:
+            out.append(f"    Empty chunk")
+            return out, None
+        
+        out.append(f"    Raw data size: {len(raw_data)} bytes")
+        
+        chunk_doc = parse_bson_chunk(raw_data)
+        
+        # Report top-level keys
+        top_keys = list(chunk_doc.keys())
+        out.append(f"    Top-level keys: {top_keys}")
+        
+        components = chunk_doc.get("Components")
+        if components is not None:
+            comp_keys = list(components.keys())
+            out.append(f"    Component keys: {comp_keys}")
+            
+            # Analyze BlockChunk (heightmap)
+            bc = components.get("BlockChunk")
+            if bc is not None:
+                hm = analyze_heightmap(bc)
+                out.append(f"\n    [BlockChunk]")
+                out.append(f"      Version: {hm.get('version', 'N/A')}")
+                out.append(f"      Needs Physics: {hm.get('needs_physics', 'N/A')}")
+                out.append(f"      Height palette count: {hm.get('height_palette_count', 'N/A')}")
+                out.append(f"      Height range: {hm.get('height_min')} - {hm.get('height_max')}")
+                out.append(f"      Sample heights: {hm.get('sample_heights', [])[:5]}")
+            
+            # Analyze ChunkColumn sections
+            cc = components.get("ChunkColumn")
+            if cc is not None:
+                sections = cc.get("Sections")
+                if sections is not None:
+                    out.append(f"\n    [ChunkColumn] {len(sections)} sections")
+                    
+                    for sec_idx, sec in enumerate(sections):
+                        sec_comps = sec.get("Components", {})
+                        
+                        # Block section
+                        block = sec_comps.get("Block")
+                        if block is not None:
+                            bs = analyze_block_section(block)
+                            block_info = f"palette={bs.get('palette_type_name', '?')}"
+                            if "entries" in bs:
+                                entry_names = [e["name"] for e in bs["entries"][:5]]
+                                block_info += f" blocks={entry_names}"
+                            out.append(f"      Section {sec_idx} (Y {sec_idx*32}-{sec_idx*32+31}): Block({block_info})")
+                        
+                        # Fluid section
+                        fluid = sec_comps.get("Fluid")
+                        if fluid is not None:
+                            fs = analyze_fluid_section(fluid)
+                            fluid_info = f"palette={fs.get('palette_type_name', '?')}"
+                            if "entries" in fs:
+                                entry_names = [e["name"] for e in fs["entries"]]
+                                fluid_info += f" fluids={entry_names}"
+                            if "fluid_block_count" in fs:
+                                fluid_info += f" count={fs['fluid_block_count']}"
+                            if "non_zero_levels" in fs:
+                                fluid_info += f" levels={fs['non_zero_levels']}"
+                            if fs.get("sample_positions"):
+                                fluid_info += f"\n        Fluid positions: {fs['sample_positions'][:10]}"
+                            if fs.get("sample_levels"):
+                                fluid_info += f"\n        Level positions: {fs['sample_levels'][:10]}"
+                            out.append(f"      Section {sec_idx} (Y {sec_idx*32}-{sec_idx*32+31}): Fluid({fluid_info})")
+                        
+                        # Other components
+                        other_comps = [k for k in sec_comps if k not in KNOWN_SECTION_COMPONENTS]
+                        if other_comps:
+                            out.append(f"      Section {sec_idx}: Other components: {other_comps}")
+            
+            # Entity chunk
+            ec = components.get("EntityChunk")
+            if ec is not None:
+                entities = ec.get("Entities")
+                if entities is not None:
+                    out.append(f"\n    [EntityChunk] {len(entities)} entities")
+        
+    except Exception as e:
+        out.append(f"    ERROR: {e}")
+        return out, traceback.format_exc()
+    
+    return out, None
+
 def analyze_region(filepath, label):
     """Analyze a region file and print summary."""
     print(f"\n{'='*80}")
@@ -255,109 +426,28 @@ def analyze_region(filepath, label):
         print(f"  FILE NOT FOUND!")
         return
     
-    with open(filepath, "rb") as f:
-        version, blob_count, segment_size = read_region_header(f)
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_WILLNEED"):
+            # Chunks are scattered across the file; have the kernel read the whole region ahead in large requests
+            # instead of faulting it in a page at a time (not available on Windows)
+            mm.madvise(mmap.MADV_WILLNEED)
+        version, blob_count, segment_size = read_region_header(mm)
         print(f"  Version: {version}, Blobs: {blob_count}, Segment Size: {segment_size}")
         
-        blob_indices = read_blob_index(f, blob_count)
+        blob_indices = read_blob_index(mm, blob_count)
         non_empty = sum(1 for idx in blob_indices if idx != 0)
         print(f"  Non-empty chunks: {non_empty}/{blob_count}")
         
-        # Find first few non-empty chunks
-        chunks_analyzed = 0
-        for blob_idx, first_segment in enumerate(blob_indices):
-            if first_segment == 0:
-                continue
-            if chunks_analyzed >= 3:  # Only analyze first 3 chunks
-                break
-            
-            local_x = blob_idx % 32
-            local_z = blob_idx // 32
-            
-            print(f"\n  --- Chunk local ({local_x}, {local_z}) ---")
-            
-            try:
-                raw_data = read_chunk(f, first_segment, blob_count, segment_size)
-                if raw_data is None:
-                    print(f"    Empty chunk")
-                    continue
-                
-                print(f"    Raw data size: {len(raw_data)} bytes")
-                
-                chunk_doc = parse_bson_chunk(raw_data)
-                
-                # Print top-level keys
-                top_keys = list(chunk_doc.keys())
-                print(f"    Top-level keys: {top_keys}")
-                
-                if "Components" in chunk_doc:
-                    comp_keys = list(chunk_doc["Components"].keys())
-                    print(f"    Component keys: {comp_keys}")
-                    
-                    # Analyze BlockChunk (heightmap)
-                    if "BlockChunk" in chunk_doc["Components"]:
-                        bc = chunk_doc["Components"]["BlockChunk"]
-                        hm = analyze_heightmap(bc)
-                        print(f"\n    [BlockChunk]")
-                        print(f"      Version: {hm.get('version', 'N/A')}")
-                        print(f"      Needs Physics: {hm.get('needs_physics', 'N/A')}")
-                        print(f"      Height palette count: {hm.get('height_palette_count', 'N/A')}")
-                        print(f"      Height range: {hm.get('height_min')} - {hm.get('height_max')}")
-                        print(f"      Sample heights: {hm.get('sample_heights', [])[:5]}")
-                    
-                    # Analyze ChunkColumn sections
-                    if "ChunkColumn" in chunk_doc["Components"]:
-                        cc = chunk_doc["Components"]["ChunkColumn"]
-                        if "Sections" in cc:
-                            sections = cc["Sections"]
-                            print(f"\n    [ChunkColumn] {len(sections)} sections")
-                            
-                            for sec_idx, sec in enumerate(sections):
-                                sec_comps = sec.get("Components", {})
-                                
-                                # Block section
-                                if "Block" in sec_comps:
-                                    bs = analyze_block_section(sec_comps["Block"])
-                                    block_info = f"palette={bs.get('palette_type_name', '?')}"
-                                    if "entries" in bs:
-                                        entry_names = [e["name"] for e in bs["entries"][:5]]
-                                        block_info += f" blocks={entry_names}"
-                                    print(f"      Section {sec_idx} (Y {sec_idx*32}-{sec_idx*32+31}): Block({block_info})")
-                                
-                                # Fluid section
-                                if "Fluid" in sec_comps:
-                                    fs = analyze_fluid_section(sec_comps["Fluid"])
-                                    fluid_info = f"palette={fs.get('palette_type_name', '?')}"
-                                    if "entries" in fs:
-                                        entry_names = [e["name"] for e in fs["entries"]]
-                                        fluid_info += f" fluids={entry_names}"
-                                    if "fluid_block_count" in fs:
-                                        fluid_info += f" count={fs['fluid_block_count']}"
-                                    if "non_zero_levels" in fs:
-                                        fluid_info += f" levels={fs['non_zero_levels']}"
-                                    if fs.get("sample_positions"):
-                                        fluid_info += f"\n        Fluid positions: {fs['sample_positions'][:10]}"
-                                    if fs.get("sample_levels"):
-                                        fluid_info += f"\n        Level positions: {fs['sample_levels'][:10]}"
-                                    print(f"      Section {sec_idx} (Y {sec_idx*32}-{sec_idx*32+31}): Fluid({fluid_info})")
-                                
-                                # Other components
-                                other_comps = [k for k in sec_comps.keys() if k not in ("Block", "Fluid", "ChunkSection")]
-                                if other_comps:
-                                    print(f"      Section {sec_idx}: Other components: {other_comps}")
-                    
-                    # Entity chunk
-                    if "EntityChunk" in chunk_doc["Components"]:
-                        ec = chunk_doc["Components"]["EntityChunk"]
-                        if "Entities" in ec:
-                            print(f"\n    [EntityChunk] {len(ec['Entities'])} entities")
-                
-            except Exception as e:
-                print(f"    ERROR: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            chunks_analyzed += 1
+        # Analyze the first few non-empty chunks in parallel; decompression and BSON parsing release the GIL.
+        # executor.map() yields results in submission order, so the report reads the same as a serial run
+        tasks = [(blob_idx, first_segment) for blob_idx, first_segment in enumerate(blob_indices)
+                 if first_segment != 0][:3]  # Only analyze first 3 chunks
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(lambda task: analyze_chunk(mm, *task, blob_count, segment_size), tasks)
+            for out, error_trace in results:
+                print("\n".join(out))
+                if error_trace:
+                    sys.stderr.write(error_trace)
 
 if __name__ == "__main__":
     # Working world (Hytale-generated)
@@ -6,54 +6,158 @@ Strategy: Each terrain category gets a distinct hue range, and within each categ
 terrains are spread across different saturation/value levels to maximise visual distinction.
 """
 
-import colorsys
+import functools
 import re
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    # Fall back to converting the colours one at a time with hsv_to_hex
+    np = None
+
 JAVA_FILE = r"c:\Users\Sotirios\Desktop\WorldPainter\WorldPainter\WPCore\src\main\java\org\pepsoft\worldpainter\hytale\HytaleTerrain.java"
 
+# Fixed text every terrain definition contains; a plain substring test rejects other lines before the regex runs
+TERRAIN_DEF_PREFIX = 'public static final HytaleTerrain '
+TERRAIN_DEF_RE = re.compile(re.escape(TERRAIN_DEF_PREFIX) + r'(\w+)\s*=')
+HEX_RE = re.compile(r'0x[0-9a-fA-F]{6}\)')
 
-def hsv_to_hex(h, s, v):
-    """Convert HSV (0-360, 0-100, 0-100) to hex colour string like 0xRRGGBB."""
-    r, g, b = colorsys.hsv_to_rgb(h / 360, s / 100, v / 100)
-    ri = max(0, min(255, int(round(r * 255))))
-    gi = max(0, min(255, int(round(g * 255))))
-    bi = max(0, min(255, int(round(b * 255))))
-    return f"0x{ri:02x}{gi:02x}{bi:02x}"
+# Colour words that, when part of a terrain name, suggest the obvious colour. Matched as plain substrings (no word
+# boundaries: "_" is a word character, so \b would miss e.g. RED in RED_MOSS)
+COLOUR_NAME_RE = re.compile('|'.join([
+    "BLUE", "CYAN", "GREEN", "GRAY", "LIME", "ORANGE", "PINK", "PURPLE", "POISONED", "POISON", "RED", "VIOLET",
+    "WHITE", "YELLOW", "NEON", "BLACK", "BROWN", "DARK_GREEN",
+]))
 
 
-def spread_colors(base_hue, hue_range, count, sat_range=(40, 95), val_range=(30, 90)):
-    """Generate `count` visually distinct colours around base_hue ± hue_range."""
-    colors = []
+def hsv_to_hex(h, s, v):
+    """Convert HSV (0-360, 0-100, 0-100) to hex colour string like 0xRRGGBB."""
+    # Same sextant formulation as colorsys.hsv_to_rgb, inlined and with the branch ladder replaced by a table lookup
+    h6 = (h / 360) * 6.0
+    i = int(h6)
+    f = h6 - i
+    vv = v / 100
+    ss = s / 100
+    p = vv * (1.0 - ss)
+    q = vv * (1.0 - ss * f)
+    t = vv * (1.0 - ss * (1.0 - f))
+    r, g, b = ((vv, t, p), (q, vv, p), (p, vv, t), (p, q, vv), (t, p, vv), (vv, p, q))[i % 6]
+    ri = max(0, min(255, round(r * 255)))
+    gi = max(0, min(255, round(g * 255)))
+    bi = max(0, min(255, round(b * 255)))
+    return "0x" + ((ri << 16) | (gi << 8) | bi).to_bytes(3, 'big').hex()
+
+
+def hsv_to_hex_batch(h, s, v):
+    """Vectorised hsv_to_hex: convert arrays of HSV (0-360, 0-100, 0-100) to a list of 0xRRGGBB strings.
+
+    Uses the same sextant formulation and rounding as hsv_to_hex, so the results are identical to the scalar version.
+    """
+    if np is None:
+        return [hsv_to_hex(hh, ss, vv) for hh, ss, vv in zip(h, s, v)]
+    h = np.asarray(h, dtype=np.float64)
+    s = np.asarray(s, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    packed = hsv_to_packed_rgb(h, s, v)
+    return ["0x" + x.to_bytes(3, 'big').hex() for x in packed.tolist()]
+
+
+def hsv_to_packed_rgb(h, s, v):
+    """Convert float64 arrays of HSV (0-360, 0-100, 0-100) to an array of packed 0xRRGGBB integers."""
+    h6 = (h / 360) * 6.0
+    s = s / 100
+    v = v / 100
+    sextant = np.floor(h6).astype(np.intp)
+    f = h6 - sextant
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    # Select the (r, g, b) sources per element from the (v, t, p, q) candidates
+    candidates = np.stack((v, t, p, q))
+    rgb = np.take_along_axis(candidates, SEXTANT_CHANNELS[sextant % 6].T, axis=0)
+    r, g, b = np.clip(np.round(rgb * 255), 0, 255).astype(np.uint32)
+    return (r << 16) | (g << 8) | b
+
+
+# Indices into the (v, t, p, q) candidates giving (r, g, b) for each of the six hue sextants
+if np is not None:
+    SEXTANT_CHANNELS = np.array([(0, 1, 2), (3, 0, 2), (2, 0, 1), (2, 3, 0), (1, 2, 0), (0, 2, 3)])
+
+
+# Golden angle in degrees, and the number of saturation and value levels that spread_colors cycles through
+GOLDEN_ANGLE = 137.508
+SAT_LEVELS = 4
+VAL_LEVELS = 5
+
+# Up to this many colours spread_colors uses plain Python (as it always does without NumPy), as NumPy's array set-up
+# costs more than it saves
+SCALAR_SPREAD_MAX = 4
+
+
+@functools.lru_cache(maxsize=None)
+def spread_index_tables(count):
+    """Return the index-only parts of spread_colors for `count` colours.
+
+    These are the golden-angle hue fractions (0-1) and the saturation and value level indices. They are cached because
+    many categories have the same size, so the returned arrays must not be modified.
+    """
+    i = np.arange(count)
+    hue_frac = (i * GOLDEN_ANGLE / 360) % 1.0
+    sat_idx = i % SAT_LEVELS
+    # Value levels are offset from the saturation levels to avoid correlation
+    val_idx = (i + 2) % VAL_LEVELS
+    return hue_frac, sat_idx, val_idx
+
+
+def spread_colors(base_hue, hue_range, count, sat_range=(40, 95), val_range=(30, 90), skip=()):
+    """Generate `count` visually distinct colours around base_hue ± hue_range.
+
+    Colours at the indices in `skip` are not computed and are returned as None, without affecting the others.
+    """
     if count == 0:
-        return colors
+        return []
     if count == 1:
+        if 0 in skip:
+            return [None]
         return [hsv_to_hex(base_hue, (sat_range[0]+sat_range[1])//2, (val_range[0]+val_range[1])//2)]
 
     # Create a grid of (hue, sat, val) combinations, then pick `count` well-spaced ones
     # Use golden angle for hue spread and interleave sat/val levels
-    import math
-    golden_angle = 137.508  # degrees
-
-    for i in range(count):
-        # Spread hue across the range
-        if hue_range > 0:
-            hue_frac = (i * golden_angle / 360) % 1.0
-            h = (base_hue - hue_range + hue_frac * 2 * hue_range) % 360
-        else:
-            h = base_hue
+    if count <= SCALAR_SPREAD_MAX or np is None:
+        # Same formulas as the vectorised version below, one colour at a time
+        colors = []
+        for i in range(count):
+            if i in skip:
+                colors.append(None)
+                continue
+            if hue_range > 0:
+                h = (base_hue - hue_range + ((i * GOLDEN_ANGLE / 360) % 1.0) * 2 * hue_range) % 360
+            else:
+                h = base_hue
+            s = sat_range[0] + (sat_range[1] - sat_range[0]) * (i % SAT_LEVELS) / max(1, SAT_LEVELS - 1)
+            v = val_range[0] + (val_range[1] - val_range[0]) * ((i + 2) % VAL_LEVELS) / max(1, VAL_LEVELS - 1)
+            colors.append(hsv_to_hex(h, s, v))
+        return colors
 
-        # Alternate saturation levels
-        sat_levels = 4
-        sat_idx = i % sat_levels
-        s = sat_range[0] + (sat_range[1] - sat_range[0]) * sat_idx / max(1, sat_levels - 1)
+    hue_frac, sat_idx, val_idx = spread_index_tables(count)
 
-        # Alternate value levels (offset from sat to avoid correlation)
-        val_levels = 5
-        val_idx = (i + 2) % val_levels
-        v = val_range[0] + (val_range[1] - val_range[0]) * val_idx / max(1, val_levels - 1)
+    # Spread hue across the range
+    if hue_range > 0:
+        h = (base_hue - hue_range + hue_frac * 2 * hue_range) % 360
+    else:
+        h = np.full(count, base_hue)
 
-        colors.append(hsv_to_hex(h, s, v))
+    # Alternate saturation and value levels
+    s = sat_range[0] + (sat_range[1] - sat_range[0]) * sat_idx / max(1, SAT_LEVELS - 1)
+    v = val_range[0] + (val_range[1] - val_range[0]) * val_idx / max(1, VAL_LEVELS - 1)
+
+    if not skip:
+        return hsv_to_hex_batch(h, s, v)
+    colors = [None] * count
+    keep = [j for j in range(count) if j not in skip]
+    for j, colour in zip(keep, hsv_to_hex_batch(h[keep], s[keep], v[keep])):
+        colors[j] = colour
     return colors
 
 
@@ -511,60 +615,125 @@ CATEGORIES = {
     },
 }
 
+# Manual overrides for key terrains that need natural-looking colours
+MANUAL_COLOURS = {
+    # Ground grass — must be distinct greens
+    "GRASS": "0x59a52c", "FULL_GRASS": "0x3cb820", "DEEP_GRASS": "0x1f6e12",
+    "SUMMER_GRASS": "0x8abf30", "WET_GRASS": "0x38964a", "COLD_GRASS": "0x5e855a",
+    "DRY_GRASS": "0xa89940", "BURNED_GRASS": "0x5c4020",
+    # Stones — distinct greys
+    "STONE": "0x808080", "BASALT": "0x3a3a3a", "BASALT_COBBLE": "0x4a4046",
+    "SHALE": "0x5a5a65", "SHALE_COBBLE": "0x686060", "SLATE": "0x505058",
+    "SLATE_COBBLE": "0x585c56", "CRACKED_SLATE": "0x484848",
+    "VOLCANIC_ROCK": "0x2e282c", "CRACKED_VOLCANIC_ROCK": "0x3a2020",
+    "COLD_MAGMA": "0x180808", "MARBLE": "0xeeeef0", "QUARTZITE": "0xdcdce0",
+    "CHALK": "0xf8f8fa", "MOSSY_STONE": "0x607850",
+    "POISONED_VOLCANIC_ROCK": "0x3a4a2a",
+    # Calcite/Salt
+    "CALCITE": "0xdbd7ca", "CALCITE_COBBLE": "0xcbc7ba", "SALT_BLOCK": "0xf0e8e0",
+    # Sand
+    "SAND": "0xdbc497", "SANDSTONE": "0xd4c099", "SANDSTONE_BRICK_SMOOTH": "0xdcbc9d",
+    "WHITE_SAND": "0xf4e8c6", "WHITE_SANDSTONE": "0xe8e0d0",
+    "WHITE_SANDSTONE_BRICK_SMOOTH": "0xf0dcd4",
+    "RED_SAND": "0xc4633c", "RED_SANDSTONE": "0xb45030",
+    "RED_SANDSTONE_BRICK_SMOOTH": "0xbc4c34", "ASHEN_SAND": "0x908870",
+    # Ice/Aqua
+    "BLUE_ICE": "0xa0d0ff", "ICE": "0xc0e0f8",
+    "AQUA_COBBLE": "0x4090a0", "AQUA_STONE": "0x50a0b0",
+    # Moss (the plain one) — must be green
+    "MOSS": "0x428640", "DARK_GREEN_MOSS": "0x2a5a20", "BLUE_MOSS": "0x3c68d4",
+    "RED_MOSS": "0xcc3438", "YELLOW_MOSS": "0xdcc438",
+}
+
+# The categories as parallel lists (in CATEGORIES order), so the main loop needs no per-category dict lookups
+CAT_NAMES = list(CATEGORIES)
+CAT_TERRAINS = [CATEGORIES[name]["terrains"] for name in CAT_NAMES]
+CAT_HUES = [CATEGORIES[name]["hue"] for name in CAT_NAMES]
+CAT_HUE_RANGES = [CATEGORIES[name]["hue_range"] for name in CAT_NAMES]
+CAT_SAT_RANGES = [CATEGORIES[name].get("sat", (40, 90)) for name in CAT_NAMES]
+CAT_VAL_RANGES = [CATEGORIES[name].get("val", (30, 85)) for name in CAT_NAMES]
+# Category-unique seed for the offsets applied by assign_colours_for_named_terrains
+CAT_SEEDS = [sum(ord(c) for c in name) for name in CAT_NAMES]
+
+
+# Obvious (hue, sat, val) for colour words in terrain names
+COLOUR_HUES = {
+    "BLUE": (220, 70, 60), "CYAN": (185, 65, 65), "GREEN": (130, 70, 55),
+    "GRAY": (0, 5, 55), "GREY": (0, 5, 55), "LIME": (90, 75, 65),
+    "LIME_GREEN": (90, 70, 65),
+    "ORANGE": (25, 85, 80), "PINK": (340, 55, 80), "PURPLE": (275, 70, 60),
+    "POISONED": (80, 30, 35), "POISON": (80, 30, 35),
+    "RED": (5, 80, 70), "VIOLET": (260, 60, 60), "WHITE": (0, 5, 93),
+    "YELLOW": (50, 80, 75), "NEON": (100, 90, 85), "BLACK": (0, 5, 15),
+    "BROWN": (25, 50, 45), "DARK_GREEN": (135, 75, 35),
+    "AMBER": (30, 75, 70), "AUTUMN": (18, 80, 72),
+    "FIRE": (10, 90, 80), "DRY": (45, 40, 55), "DEAD": (30, 20, 40),
+    "BURNED": (20, 35, 30), "BURNT": (20, 35, 30),
+    "CRYSTAL": (200, 40, 80), "SNOWY": (195, 15, 88), "PETRIFIED": (60, 15, 40),
+    "AZURE": (210, 55, 70), "SHALLOW": (55, 65, 70),
+    "BLOOD": (0, 80, 65), "STORM": (220, 25, 70),
+    "SPOTTED_GREEN": (100, 60, 55), "SPOTTED_ALLIUM": (290, 40, 50),
+}
+
+# Longest keys first, so that e.g. DARK_GREEN wins over GREEN and POISONED over POISON
+SORTED_COLOUR_HUES = sorted(COLOUR_HUES.items(), key=lambda x: -len(x[0]))
+
+
+def assign_colours_for_named_terrains(cat_seed, terrains, base_hue, hue_range, sat_range, val_range,
+                                      skip=frozenset()):
+    """For colour-named terrains (coral, moss, crystals), assign the obvious colour, offset by the category's seed.
 
-def assign_colours_for_named_terrains(category_name, terrains, base_hue, hue_range, sat_range, val_range):
-    """For colour-named terrains (coral, moss, crystals), assign the obvious colour."""
-    colour_hues = {
-        "BLUE": (220, 70, 60), "CYAN": (185, 65, 65), "GREEN": (130, 70, 55),
-        "GRAY": (0, 5, 55), "GREY": (0, 5, 55), "LIME": (90, 75, 65),
-        "LIME_GREEN": (90, 70, 65),
-        "ORANGE": (25, 85, 80), "PINK": (340, 55, 80), "PURPLE": (275, 70, 60),
-        "POISONED": (80, 30, 35), "POISON": (80, 30, 35),
-        "RED": (5, 80, 70), "VIOLET": (260, 60, 60), "WHITE": (0, 5, 93),
-        "YELLOW": (50, 80, 75), "NEON": (100, 90, 85), "BLACK": (0, 5, 15),
-        "BROWN": (25, 50, 45), "DARK_GREEN": (135, 75, 35),
-        "AMBER": (30, 75, 70), "AUTUMN": (18, 80, 72),
-        "FIRE": (10, 90, 80), "DRY": (45, 40, 55), "DEAD": (30, 20, 40),
-        "BURNED": (20, 35, 30), "BURNT": (20, 35, 30),
-        "CRYSTAL": (200, 40, 80), "SNOWY": (195, 15, 88), "PETRIFIED": (60, 15, 40),
-        "AZURE": (210, 55, 70), "SHALLOW": (55, 65, 70),
-        "BLOOD": (0, 80, 65), "STORM": (220, 25, 70),
-        "SPOTTED_GREEN": (100, 60, 55), "SPOTTED_ALLIUM": (290, 40, 50),
-    }
-
-    # Use a category-unique seed for offsets
-    cat_seed = sum(ord(c) for c in category_name)
+    Terrains in `skip` still take part in the per-colour offsets (so the other colours do not change), but their own
+    colour is not computed and is returned as None.
+    """
+    # Category-specific part of the offsets
+    h_off_base = (cat_seed * 7) % 15 - 7
+    s_off_base = (cat_seed * 3) % 20 - 10
+    v_off_base = (cat_seed * 5) % 16 - 8
 
     results = {}
+    matched_terrains = []
+    matched_hsv = []
     unmatched = []
     # Track how many times each colour key is used within this category
     colour_key_count = {}
 
     for t in terrains:
-        matched = False
-        for colour_key, (h, s, v) in sorted(colour_hues.items(), key=lambda x: -len(x[0])):
+        for colour_key, (h, s, v) in SORTED_COLOUR_HUES:
             if colour_key in t:
-                # Track index for this colour within category
-                idx = colour_key_count.get(colour_key, 0)
-                colour_key_count[colour_key] = idx + 1
-
-                # Apply category-specific and index-specific offsets
-                h_off = (cat_seed * 7) % 15 - 7 + idx * 5
-                s_off = (cat_seed * 3) % 20 - 10 + idx * 8
-                v_off = (cat_seed * 5) % 16 - 8 - idx * 6
-
-                h2 = (h + h_off) % 360
-                s2 = max(5, min(100, s + s_off))
-                v2 = max(10, min(100, v + v_off))
-                results[t] = hsv_to_hex(h2, s2, v2)
-                matched = True
                 break
-        if not matched:
+        else:
             unmatched.append(t)
+            continue
+
+        # Track index for this colour within category
+        idx = colour_key_count.get(colour_key, 0)
+        colour_key_count[colour_key] = idx + 1
+
+        # Apply category-specific and index-specific offsets
+        h_off = h_off_base + idx * 5
+        s_off = s_off_base + idx * 8
+        v_off = v_off_base - idx * 6
+
+        # Reserve the terrain's slot now, so the batched colours filled in below keep the loop order
+        results[t] = None
+        if t in skip:
+            continue
+
+        h2 = (h + h_off) % 360
+        s2 = max(5, min(100, s + s_off))
+        v2 = max(10, min(100, v + v_off))
+        matched_terrains.append(t)
+        matched_hsv.append((h2, s2, v2))
+
+    # Convert all matched colours in one go
+    if matched_terrains:
+        results.update(zip(matched_terrains, hsv_to_hex_batch(*zip(*matched_hsv))))
 
     # Handle unmatched with spread_colors
     if unmatched:
-        colors = spread_colors(base_hue, hue_range, len(unmatched), sat_range, val_range)
+        unmatched_skip = {i for i, t in enumerate(unmatched) if t in skip}
+        colors = spread_colors(base_hue, hue_range, len(unmatched), sat_range, val_range, unmatched_skip)
         for i, t in enumerate(unmatched):
             results[t] = colors[i]
 
@@ -572,121 +741,83 @@ def assign_colours_for_named_terrains(category_name, terrains, base_hue, hue_ran
 
 
 def main():
-    with open(JAVA_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Collect all colour assignments
-    all_colours = {}
-
-    # Manual overrides for key terrains that need natural-looking colours
-    MANUAL_COLOURS = {
-        # Ground grass — must be distinct greens
-        "GRASS": "0x59a52c", "FULL_GRASS": "0x3cb820", "DEEP_GRASS": "0x1f6e12",
-        "SUMMER_GRASS": "0x8abf30", "WET_GRASS": "0x38964a", "COLD_GRASS": "0x5e855a",
-        "DRY_GRASS": "0xa89940", "BURNED_GRASS": "0x5c4020",
-        # Stones — distinct greys
-        "STONE": "0x808080", "BASALT": "0x3a3a3a", "BASALT_COBBLE": "0x4a4046",
-        "SHALE": "0x5a5a65", "SHALE_COBBLE": "0x686060", "SLATE": "0x505058",
-        "SLATE_COBBLE": "0x585c56", "CRACKED_SLATE": "0x484848",
-        "VOLCANIC_ROCK": "0x2e282c", "CRACKED_VOLCANIC_ROCK": "0x3a2020",
-        "COLD_MAGMA": "0x180808", "MARBLE": "0xeeeef0", "QUARTZITE": "0xdcdce0",
-        "CHALK": "0xf8f8fa", "MOSSY_STONE": "0x607850",
-        "POISONED_VOLCANIC_ROCK": "0x3a4a2a",
-        # Calcite/Salt
-        "CALCITE": "0xdbd7ca", "CALCITE_COBBLE": "0xcbc7ba", "SALT_BLOCK": "0xf0e8e0",
-        # Sand
-        "SAND": "0xdbc497", "SANDSTONE": "0xd4c099", "SANDSTONE_BRICK_SMOOTH": "0xdcbc9d",
-        "WHITE_SAND": "0xf4e8c6", "WHITE_SANDSTONE": "0xe8e0d0",
-        "WHITE_SANDSTONE_BRICK_SMOOTH": "0xf0dcd4",
-        "RED_SAND": "0xc4633c", "RED_SANDSTONE": "0xb45030",
-        "RED_SANDSTONE_BRICK_SMOOTH": "0xbc4c34", "ASHEN_SAND": "0x908870",
-        # Ice/Aqua
-        "BLUE_ICE": "0xa0d0ff", "ICE": "0xc0e0f8",
-        "AQUA_COBBLE": "0x4090a0", "AQUA_STONE": "0x50a0b0",
-        # Moss (the plain one) — must be green
-        "MOSS": "0x428640", "DARK_GREEN_MOSS": "0x2a5a20", "BLUE_MOSS": "0x3c68d4",
-        "RED_MOSS": "0xcc3438", "YELLOW_MOSS": "0xdcc438",
-    }
-    for cat_name, cat_info in CATEGORIES.items():
-        terrains = cat_info["terrains"]
-        base_hue = cat_info["hue"]
-        hue_range = cat_info["hue_range"]
-        sat_range = cat_info.get("sat", (40, 90))
-        val_range = cat_info.get("val", (30, 85))
+    # Collect all colour assignments as (terrain, colour) pairs; the dict is built once at the end
+    colour_pairs = []
+
+    # Terrains with a manual override; their generated colour would be thrown away, so it is not computed (they come
+    # back as None placeholders, which keep their position and are filled in by the overrides below)
+    manual_set = set(MANUAL_COLOURS)
 
+    for terrains, base_hue, hue_range, sat_range, val_range, cat_seed in zip(
+            CAT_TERRAINS, CAT_HUES, CAT_HUE_RANGES, CAT_SAT_RANGES, CAT_VAL_RANGES, CAT_SEEDS):
         # For categories that have explicit colour names in terrain names (coral, moss, crystal, orchid, etc)
-        has_colour_names = any(
-            word in t for t in terrains
-            for word in ["BLUE", "CYAN", "GREEN", "GRAY", "LIME", "ORANGE", "PINK",
-                        "PURPLE", "POISONED", "POISON", "RED", "VIOLET", "WHITE",
-                        "YELLOW", "NEON", "BLACK", "BROWN", "DARK_GREEN"]
-        )
+        has_colour_names = any(COLOUR_NAME_RE.search(t) for t in terrains)
 
         if has_colour_names and hue_range >= 30:
-            colours = assign_colours_for_named_terrains(cat_name, terrains, base_hue, hue_range, sat_range, val_range)
+            colours = assign_colours_for_named_terrains(cat_seed, terrains, base_hue, hue_range,
+                                                        sat_range, val_range, manual_set)
         else:
-            colors = spread_colors(base_hue, hue_range, len(terrains), sat_range, val_range)
+            skip = {i for i, t in enumerate(terrains) if t in manual_set}
+            colors = spread_colors(base_hue, hue_range, len(terrains), sat_range, val_range, skip)
             colours = dict(zip(terrains, colors))
 
-        all_colours.update(colours)
+        colour_pairs.extend(colours.items())
+
+    all_colours = dict(colour_pairs)
 
     # Apply manual overrides LAST so they take priority
     all_colours.update(MANUAL_COLOURS)
 
-    # Ensure all colours are unique — nudge any duplicates
-    used_colours = {}
-    for terrain_name in list(all_colours.keys()):
-        colour = all_colours[terrain_name]
-        while colour in used_colours:
-            # Parse and nudge
-            val = int(colour, 16)
-            r = (val >> 16) & 0xFF
-            g = (val >> 8) & 0xFF
-            b = val & 0xFF
-            # Nudge each channel slightly in a deterministic direction
-            r = max(0, min(255, r + 3))
-            g = max(0, min(255, g + 7))
-            b = max(0, min(255, b - 5))
-            colour = f"0x{r:02x}{g:02x}{b:02x}"
-        used_colours[colour] = terrain_name
-        all_colours[terrain_name] = colour
+    # Ensure all colours are unique — nudge any duplicates. Works on packed 0xRRGGBB integers so that probing a
+    # collision needs no string parsing or formatting
+    used_colours = set()
+    for terrain_name, colour in all_colours.items():
+        val = int(colour, 16)
+        if val in used_colours:
+            while val in used_colours:
+                # Nudge each channel slightly in a deterministic direction
+                r = max(0, min(255, ((val >> 16) & 0xFF) + 3))
+                g = max(0, min(255, ((val >> 8) & 0xFF) + 7))
+                b = max(0, min(255, (val & 0xFF) - 5))
+                val = (r << 16) | (g << 8) | b
+            all_colours[terrain_name] = f"0x{val:06x}"
+        used_colours.add(val)
 
     # Now apply the colours to the Java file
     # Terrain defs span two lines:
     #   public static final HytaleTerrain NAME = new HytaleTerrain("...",
     #       HytaleBlock.of("..."), 0xRRGGBB);
+    # The file is streamed line by line into a temporary file, which then replaces the original
     changed = 0
-    lines = content.split('\n')
-    new_lines = []
     pending_terrain = None
-
-    for line in lines:
-        # Check if this line starts a terrain definition
-        m = re.search(r'public static final HytaleTerrain (\w+)\s*=', line)
-        if m:
-            pending_terrain = m.group(1)
-
-        # Check if this line has a hex colour (the second line of the definition)
-        if pending_terrain and re.search(r'0x[0-9a-fA-F]{6}\)', line):
-            if pending_terrain in all_colours:
-                new_colour = all_colours[pending_terrain]
-                old_line = line
-                line = re.sub(r'0x[0-9a-fA-F]{6}\)', f'{new_colour})', line)
-                if line != old_line:
-                    changed += 1
-            pending_terrain = None
-
-        new_lines.append(line)
+    found_terrains = set()
+    tmp_file = JAVA_FILE + '.tmp'
+
+    with open(JAVA_FILE, 'r', encoding='utf-8') as fin, open(tmp_file, 'w', encoding='utf-8') as fout:
+        for line in fin:
+            # Check if this line starts a terrain definition
+            if TERRAIN_DEF_PREFIX in line:
+                m = TERRAIN_DEF_RE.search(line)
+                if m:
+                    pending_terrain = m.group(1)
+                    found_terrains.add(pending_terrain)
+
+            # Check if this line has a hex colour (the second line of the definition)
+            if pending_terrain:
+                hex_match = HEX_RE.search(line)
+                if hex_match:
+                    new_colour = all_colours.get(pending_terrain)
+                    # Splice the new value in at the match already found; only the matched text is compared
+                    if new_colour is not None and hex_match.group() != f'{new_colour})':
+                        line = f'{line[:hex_match.start()]}{new_colour}){line[hex_match.end():]}'
+                        changed += 1
+                    pending_terrain = None
+
+            fout.write(line)
 
     print(f"Changed {changed} colour values out of {len(all_colours)} planned")
 
     # Check for any planned terrains not found
-    found_terrains = set()
-    for line in content.split('\n'):
-        m = re.search(r'public static final HytaleTerrain (\w+)\s*=', line)
-        if m:
-            found_terrains.add(m.group(1))
-
     missing = set(all_colours.keys()) - found_terrains
     if missing:
         print(f"WARNING: {len(missing)} terrains in categories not found in Java file:")
@@ -699,8 +830,7 @@ def main():
         for u in sorted(uncategorised):
             print(f"  {u}")
 
-    with open(JAVA_FILE, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(new_lines))
+    os.replace(tmp_file, JAVA_FILE)
 
     print("Done!")
 